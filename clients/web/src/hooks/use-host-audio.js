@@ -10,16 +10,6 @@ function floatTo16BitPCM(input) {
   return output.buffer;
 }
 
-function arrayBufferToBase64(buffer) {
-  let binary = "";
-  const bytes = new Uint8Array(buffer);
-  const len = bytes.byteLength;
-  for (let i = 0; i < len; i++) {
-    binary += String.fromCharCode(bytes[i]);
-  }
-  return window.btoa(binary);
-}
-
 function downsampleBuffer(buffer, inputSampleRate, outputSampleRate) {
   if (outputSampleRate === inputSampleRate) {
     return buffer;
@@ -49,7 +39,6 @@ function downsampleBuffer(buffer, inputSampleRate, outputSampleRate) {
 
 const SILENCE_SAMPLES = new Float32Array(4096).fill(0);
 const SILENCE_PCM = floatTo16BitPCM(SILENCE_SAMPLES);
-const SILENCE_BASE64 = arrayBufferToBase64(SILENCE_PCM);
 
 export function useHostAudio(sessionId, integration) {
   const [isAudioInitialized, setIsAudioInitialized] = useState(false);
@@ -115,11 +104,7 @@ export function useHostAudio(sessionId, integration) {
         wsRef.current?.readyState === WebSocket.OPEN &&
         !isAudioInitializedRef.current
       ) {
-        wsRef.current.send(
-          JSON.stringify({
-            audio: SILENCE_BASE64,
-          }),
-        );
+        wsRef.current.send(SILENCE_PCM);
       }
     }, 250);
 
@@ -277,14 +262,8 @@ export function useHostAudio(sessionId, integration) {
             16000,
           );
 
-          const pcmBuffer = floatTo16BitPCM(downsampledData);
-          const base64Audio = arrayBufferToBase64(pcmBuffer);
-
-          wsRef.current.send(
-            JSON.stringify({
-              audio: base64Audio,
-            }),
-          );
+          // Raw PCM goes out as a binary frame; no base64 or JSON wrapping.
+          wsRef.current.send(floatTo16BitPCM(downsampledData));
         }
       };
 
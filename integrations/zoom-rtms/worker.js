@@ -14,6 +14,12 @@ let metricsInterval = null;
 let lastCpuUsage = process.cpuUsage();
 let lastCpuTime = Date.now();
 
+// Backend auth tokens live for five minutes; reuse one across reconnects
+// until it is close to expiry instead of re-signing RS256 every attempt.
+const AUTH_TOKEN_TTL_SECONDS = 300;
+const AUTH_TOKEN_REFRESH_MARGIN_SECONDS = 60;
+let cachedAuthToken = null;
+
 function log(msg) {
   console.log(`[${new Date().toISOString()}][Worker ${process.pid}] ${msg}`);
 }
@@ -67,16 +73,31 @@ function startMetricsReporting() {
 }
 
 function generateAuthToken(host_id) {
+  const now = Math.floor(Date.now() / 1000);
+  if (
+    cachedAuthToken &&
+    cachedAuthToken.hostId === host_id &&
+    cachedAuthToken.expiresAt - now > AUTH_TOKEN_REFRESH_MARGIN_SECONDS
+  ) {
+    return cachedAuthToken.token;
+  }
+
   const payload = {
     iss: "zoom-rtms-service",
-    iat: Math.floor(Date.now() / 1000),
+    iat: now,
     aud: "python-backend",
     zoom_host_id: host_id,
   };
-  return jwt.sign(payload, ZM_PRIVATE_KEY, {
-    expiresIn: "5m",
+  const token = jwt.sign(payload, ZM_PRIVATE_KEY, {
+    expiresIn: AUTH_TOKEN_TTL_SECONDS,
     algorithm: "RS256",
   });
+  cachedAuthToken = {
+    hostId: host_id,
+    token,
+    expiresAt: now + AUTH_TOKEN_TTL_SECONDS,
+  };
+  return token;
 }
 
 function handlePromotion() {
@@ -116,6 +137,7 @@ function handleRtmsStarted(payload, streamId, isPrimary) {
     rtmsClient,
     wsClient: null,
     hasLoggedWarning: false,
+    announcedSpeaker: null,
     streamId,
     isPrimary,
     connect: null,
@@ -145,6 +167,7 @@ function handleRtmsStarted(payload, streamId, isPrimary) {
     wsClient.on("open", () => {
       log("Backend WebSocket Connected (OPEN).");
       currentClientEntry.hasLoggedWarning = false;
+      currentClientEntry.announcedSpeaker = null;
 
       const meta = {
         meeting_uuid,
@@ -201,11 +224,13 @@ function handleRtmsStarted(payload, streamId, isPrimary) {
     const speakerName = metadata.userName || "Zoom RTMS";
 
     if (wsClient && wsClient.readyState === WebSocket.OPEN) {
-      const payload = {
-        userName: speakerName,
-        audio: data.toString("base64"),
-      };
-      wsClient.send(JSON.stringify(payload));
+      // Announce the speaker only when it changes; the backend attributes
+      // the binary PCM frames that follow to the last announced name.
+      if (currentClientEntry.announcedSpeaker !== speakerName) {
+        wsClient.send(JSON.stringify({ userName: speakerName }));
+        currentClientEntry.announcedSpeaker = speakerName;
+      }
+      wsClient.send(data);
     }
   });
 
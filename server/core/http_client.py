@@ -1,19 +1,30 @@
 import httpx
 
+# httpx's default pool limits, except idle connections to the upstream APIs
+# (Zoom, Graph, calendar) are kept for 30s instead of 5s. The connection caps
+# are restated because a bare httpx.Limits() leaves the pool unbounded.
+HTTP_CLIENT_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+)
+
 _shared_http_client: httpx.AsyncClient | None = None
 
 
+def _build_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(limits=HTTP_CLIENT_LIMITS)
+
+
 def get_http_client() -> httpx.AsyncClient:
     global _shared_http_client
     if _shared_http_client is None:
-        _shared_http_client = httpx.AsyncClient()
+        _shared_http_client = _build_http_client()
     return _shared_http_client
 
 
 async def init_http_client():
     global _shared_http_client
     if _shared_http_client is None:
-        _shared_http_client = httpx.AsyncClient()
+        _shared_http_client = _build_http_client()
 
 
 async def close_http_client():
@@ -11,6 +11,11 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.orm import DeclarativeBase
 
 
+# Held for the schema-init transaction so multiple uvicorn workers booting
+# together don't race each other through create_all.
+SCHEMA_INIT_LOCK_ID = 7341002
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -43,6 +48,7 @@ async def init_orm() -> None:
     import models
 
     async with engine.begin() as conn:
+        await conn.execute(text(f"SELECT pg_advisory_xact_lock({SCHEMA_INIT_LOCK_ID})"))
         await conn.run_sync(Base.metadata.create_all)
         for statement in models.POST_CREATE_STATEMENTS:
             await conn.execute(text(statement))
@@ -1,7 +1,8 @@
 import asyncio
 import logging
 import random
-from typing import AsyncGenerator, List, Optional
+from collections import OrderedDict, deque
+from typing import AsyncGenerator, Deque, List, Optional, Tuple
 
 from core.config import settings
 from core.logging_setup import log_step, session_id_var
@@ -10,6 +11,11 @@ from openai import APIStatusError, APITimeoutError, AsyncOpenAI
 logger = logging.getLogger(__name__)
 
 GLOBAL_REQUEST_SEMAPHORE = asyncio.Semaphore(2)
+# Number of history items translated ahead of the one being broadcast.
+BACKFILL_TRANSLATION_WINDOW = 4
+# Recent translations kept in memory so repeated phrases and re-requested
+# languages skip the Qwen round trip.
+BACKFILL_CACHE_SIZE = 2048
 
 
 class BackfillService:
@@ -24,6 +30,9 @@ class BackfillService:
             base_url="https://dashscope-intl.aliyuncs.com/compatible-mode/v1",
             max_retries=0,
         )
+        self._translation_cache: "OrderedDict[Tuple[str, str, str], str]" = (
+            OrderedDict()
+        )
         with log_step("BACKFILL"):
             logger.debug("Initialized BackfillService with Qwen client.")
 
@@ -33,24 +42,23 @@ class BackfillService:
         """
         Translates a single string using Qwen-MT-Turbo with robust rate limiting.
         """
+        cache_key = (text, source_lang, target_lang)
+        cached = self._translation_cache.get(cache_key)
+        if cached is not None:
+            self._translation_cache.move_to_end(cache_key)
+            return cached
+
         max_retries = 8
         base_delay = 2.0
 
         async with GLOBAL_REQUEST_SEMAPHORE:
             for attempt in range(1, max_retries + 1):
                 try:
+                    # Qwen-MT takes the language pair from translation_options and
+                    # does not accept a system message, so only the text is sent.
                     response = await self.client.chat.completions.create(
                         model="qwen-mt-turbo",
-                        messages=[
-                            {
-                                "role": "user",
-                                "content": (
-                                    f"Translate this {source_lang} text to {target_lang}. "
-                                    "Output ONLY the translation, no other text:\n\n"
-                                    f"{text}"
-                                ),
-                            }
-                        ],
+                        messages=[{"role": "user", "content": text}],
                         extra_body={
                             "translation_options": {
                                 "source_lang": source_lang,
@@ -58,7 +66,12 @@ class BackfillService:
                             }
                         },
                     )
-                    return response.choices[0].message.content.strip()
+                    translated = response.choices[0].message.content.strip()
+                    if translated:
+                        self._translation_cache[cache_key] = translated
+                        if len(self._translation_cache) > BACKFILL_CACHE_SIZE:
+                            self._translation_cache.popitem(last=False)
+                    return translated
 
                 except (APIStatusError, APITimeoutError) as e:
                     is_rate_limit = (
@@ -122,22 +135,49 @@ class BackfillService:
                     f"covering utterances 1 to {upto_count}."
                 )
 
-            for i in range(1, upto_count + 1):
-                target_msg_id = f"{i}_en"
-                item = await self._fetch_or_wait_for_item(
-                    session_id, target_msg_id, viewer_manager
-                )
+            # Translations overlap (still capped by GLOBAL_REQUEST_SEMAPHORE),
+            # but results are broadcast in utterance order so the cached
+            # history keeps its ordering.
+            in_flight: Deque[asyncio.Task] = deque()
+            try:
+                for i in range(1, upto_count + 1):
+                    # Send whatever has already finished before a fetch that
+                    # may wait on a late utterance.
+                    while in_flight and in_flight[0].done():
+                        await self._broadcast_backfill_result(
+                            in_flight.popleft(), session_id, viewer_manager
+                        )
 
-                if item:
-                    await self._process_backfill_item(
-                        item, session_id, target_lang, viewer_manager
+                    target_msg_id = f"{i}_en"
+                    item = await self._fetch_or_wait_for_item(
+                        session_id, target_msg_id, viewer_manager
                     )
-                else:
-                    with log_step("BACKFILL"):
-                        logger.warning(
-                            f"Backfill skipped missing utterance {target_msg_id} "
-                            "after waiting."
+
+                    if item:
+                        in_flight.append(
+                            asyncio.create_task(
+                                self._translate_backfill_item(item, target_lang)
+                            )
                         )
+                    else:
+                        with log_step("BACKFILL"):
+                            logger.warning(
+                                f"Backfill skipped missing utterance {target_msg_id} "
+                                "after waiting."
+                            )
+
+                    if len(in_flight) >= BACKFILL_TRANSLATION_WINDOW:
+                        await self._broadcast_backfill_result(
+                            in_flight.popleft(), session_id, viewer_manager
+                        )
+
+                while in_flight:
+                    await self._broadcast_backfill_result(
+                        in_flight.popleft(), session_id, viewer_manager
+                    )
+            finally:
+                for task in in_flight:
+                    task.cancel()
 
             await viewer_manager.broadcast_to_session(
                 session_id, {"type": "backfill_end", "target_language": target_lang}
@@ -221,34 +261,47 @@ class BackfillService:
         finally:
             session_id_var.reset(session_token)
 
+    async def _broadcast_backfill_result(
+        self, task: asyncio.Task, session_id, viewer_manager
+    ):
+        payload = await task
+        if payload:
+            await viewer_manager.broadcast_to_session(session_id, payload)
+
     async def _process_backfill_item(
         self, item, session_id, target_lang, viewer_manager
     ):
         """Helper to translate and broadcast a single history item."""
+        payload = await self._translate_backfill_item(item, target_lang)
+        if payload:
+            await viewer_manager.broadcast_to_session(session_id, payload)
+
+    async def _translate_backfill_item(self, item, target_lang) -> Optional[dict]:
+        """Translates a single history item into its backfill payload."""
         if not item.get("isfinalize") or item.get("type") not in (
             "final",
             "correction",
         ):
-            return
+            return None
 
         original_text = item.get("transcription")
         if not original_text:
-            return
+            return None
 
         try:
             utterance_num = item["message_id"].split("_")[0]
             new_message_id = f"{utterance_num}_{target_lang}"
         except IndexError:
-            return
+            return None
 
         translated_text = await self._translate_text(
             text=original_text, source_lang="en", target_lang=target_lang
         )
 
         if not translated_text:
-            return
+            return None
 
-        payload = {
+        return {
             "message_id": new_message_id,
             "transcription": original_text,
             "translation": translated_text,
@@ -260,5 +313,3 @@ class BackfillService:
             "vtt_timestamp": item.get("vtt_timestamp"),
             "is_backfill": True,
         }
-
-        await viewer_manager.broadcast_to_session(session_id, payload)
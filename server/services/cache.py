@@ -1,7 +1,7 @@
 import logging
-import json
 from typing import Any, Dict, List
 
+import orjson
 from core.config import settings
 from core.logging_setup import log_step, message_id_var, session_id_var, speaker_var
 from redis import asyncio as aioredis
@@ -76,8 +76,10 @@ class TranscriptCache:
             msg_id_token = message_id_var.set(oldest_id)
             with log_step("CACHE"):
                 logger.debug(
-                    f"Evicted item from Redis cache. Size: {old_size} bytes. "
-                    f"Session-language current size now {current_size_int - old_size} bytes."
+                    "Evicted item from Redis cache. Size: %d bytes. "
+                    "Session-language current size now %d bytes.",
+                    old_size,
+                    current_size_int - old_size,
                 )
             message_id_var.reset(msg_id_token)
 
@@ -104,8 +106,19 @@ class TranscriptCache:
             spk_token = speaker_var.set(speaker)
             msg_id_token = message_id_var.set(message_id)
             is_backfill_override = payload.get("is_backfill", False)
+            message_type = payload.get("type")
+            is_finalize = payload.get("isfinalize") is True
 
             try:
+                # Partials are never stored, so skip the Redis round trip for
+                # the bulk of the live stream.
+                if not (
+                    is_finalize
+                    or is_backfill_override
+                    or message_type in ("correction", "status_update")
+                ):
+                    return
+
                 items_key = self._language_items_key(session_id, language_code)
                 order_key = self._language_order_key(session_id, language_code)
                 meta_key = self._language_meta_key(session_id, language_code)
@@ -113,13 +126,15 @@ class TranscriptCache:
 
                 existing_json = await self._redis.hget(items_key, message_id)
 
-                if existing_json is None and payload.get("isfinalize") is True:
-                    encoded_payload = json.dumps(payload, separators=(",", ":"))
-                    payload_size = len(encoded_payload.encode("utf-8"))
+                if existing_json is None and is_finalize:
+                    encoded_payload = orjson.dumps(payload)
+                    payload_size = len(encoded_payload)
 
                     async with self._redis.pipeline(transaction=True) as pipe:
                         pipe.rpush(order_key, message_id)
-                        pipe.hset(items_key, message_id, encoded_payload)
+                        pipe.hset(
+                            items_key, message_id, encoded_payload.decode("utf-8")
+                        )
                         pipe.hincrby(meta_key, "current_size", payload_size)
                         pipe.sadd(langs_key, language_code)
                         await pipe.execute()
@@ -130,8 +145,7 @@ class TranscriptCache:
                 if existing_json is None:
                     return
 
-                message_type = payload.get("type")
-                old_payload = json.loads(existing_json)
+                old_payload = orjson.loads(existing_json)
                 old_size = len(existing_json.encode("utf-8"))
 
                 if message_type == "correction" or is_backfill_override:
@@ -148,8 +162,9 @@ class TranscriptCache:
                 else:
                     return
 
-                merged_json = json.dumps(merged_payload, separators=(",", ":"))
-                new_size = len(merged_json.encode("utf-8"))
+                merged_bytes = orjson.dumps(merged_payload)
+                merged_json = merged_bytes.decode("utf-8")
+                new_size = len(merged_bytes)
                 size_diff = new_size - old_size
 
                 async with self._redis.pipeline(transaction=True) as pipe:
@@ -164,7 +179,7 @@ class TranscriptCache:
 
                 with log_step("CACHE"):
                     logger.debug(
-                        f"{log_msg} Size diff: {size_diff} bytes for {message_id}."
+                        "%s Size diff: %d bytes for %s.", log_msg, size_diff, message_id
                     )
             finally:
                 speaker_var.reset(spk_token)
@@ -172,11 +187,10 @@ class TranscriptCache:
         finally:
             session_id_var.reset(session_token)
 
-    async def get_history(
-        self, session_id: str, language_code: str
-    ) -> List[Dict[str, Any]]:
+    async def get_history_raw(self, session_id: str, language_code: str) -> List[str]:
         """
-        Retrieves the history for a specific session and language.
+        Retrieves the history for a specific session and language as the
+        serialized JSON strings stored in Redis, ready to be sent as-is.
         """
         session_token = session_id_var.set(session_id)
         try:
@@ -187,14 +201,19 @@ class TranscriptCache:
                 return []
 
             payloads = await self._redis.hmget(items_key, message_ids)
-            history: List[Dict[str, Any]] = []
-            for payload in payloads:
-                if payload:
-                    history.append(json.loads(payload))
-            return history
+            return [payload for payload in payloads if payload]
         finally:
             session_id_var.reset(session_token)
 
+    async def get_history(
+        self, session_id: str, language_code: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves the history for a specific session and language.
+        """
+        raw_history = await self.get_history_raw(session_id, language_code)
+        return [orjson.loads(payload) for payload in raw_history]
+
     async def get_message(
         self, session_id: str, language_code: str, message_id: str
     ) -> Dict[str, Any] | None:
@@ -206,7 +225,7 @@ class TranscriptCache:
             payload = await self._redis.hget(items_key, message_id)
             if not payload:
                 return None
-            return json.loads(payload)
+            return orjson.loads(payload)
         finally:
             session_id_var.reset(session_token)
 
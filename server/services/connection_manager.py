@@ -1,11 +1,11 @@
 import asyncio
-import json
 import logging
 import threading
 import uuid
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Set
 
+import orjson
 from core.config import settings
 from core.db import AsyncSessionLocal
 from core.logging_setup import log_step, session_id_var
@@ -17,13 +17,16 @@ from .cache import TranscriptCache
 
 logger = logging.getLogger(__name__)
 
+PUBSUB_DRAIN_LIMIT = 256
+VIEWER_SEND_TIMEOUT_SECONDS = 1.0
+
 
 class ConnectionManager:
     """Manages active WebSocket connections, segmented by session_id."""
 
     def __init__(self, cache: TranscriptCache):
         """Initializes the manager with connections and a transcript cache."""
-        self.sessions: Dict[str, List[WebSocket]] = {}
+        self.sessions: Dict[str, Set[WebSocket]] = {}
         self.active_transcription_sessions: Dict[str, Dict[str, Any]] = {}
         self.socket_languages: Dict[WebSocket, str] = {}
         self.socket_users: Dict[WebSocket, str] = {}
@@ -102,7 +105,7 @@ class ConnectionManager:
                 await self._redis.srem(self._active_sessions_key, session_id)
                 continue
 
-            local_sockets = self.sessions.get(session_id, [])
+            local_sockets = self.sessions.get(session_id, ())
             language_counts = {}
             for ws in local_sockets:
                 lang = self.socket_languages.get(ws, "unknown")
@@ -220,7 +223,12 @@ class ConnectionManager:
                 f"Error handling control message '{cmd_type}' for session {session_id}: {e}"
             )
 
-    async def _send_to_local_viewers(self, session_id: str, payload: Dict[str, Any]):
+    async def _send_to_local_viewers(
+        self,
+        session_id: str,
+        payload: Dict[str, Any],
+        encoded_payload: bytes | None = None,
+    ):
         if session_id not in self.sessions:
             return
 
@@ -235,8 +243,99 @@ class ConnectionManager:
                 connections_to_send.append(conn)
 
         if connections_to_send:
-            tasks = [conn.send_json(payload) for conn in connections_to_send]
-            await asyncio.gather(*tasks, return_exceptions=True)
+            # Encode once per fan-out rather than once per viewer via send_json.
+            if encoded_payload is None:
+                encoded_payload = orjson.dumps(payload)
+            message = encoded_payload.decode("utf-8")
+            tasks = [
+                asyncio.wait_for(conn.send_text(message), VIEWER_SEND_TIMEOUT_SECONDS)
+                for conn in connections_to_send
+            ]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            for conn, result in zip(connections_to_send, results):
+                if isinstance(result, Exception):
+                    await self._reap_viewer(conn, session_id, result)
+
+    async def _reap_viewer(self, websocket: WebSocket, session_id: str, error: Exception):
+        """
+        Drops a viewer whose send failed or stalled so it stops holding up
+        future broadcasts for the rest of the session.
+        """
+        with log_step("CONN-MANAGER"):
+            logger.warning(
+                f"Dropping unresponsive viewer from session {session_id}: "
+                f"{type(error).__name__}"
+            )
+        await self.disconnect(websocket, session_id)
+        try:
+            await asyncio.wait_for(websocket.close(code=1011), VIEWER_SEND_TIMEOUT_SECONDS)
+        except Exception:
+            pass
+
+    def _coalesce_pubsub_batch(self, batch: List[Dict[str, Any]]) -> List[tuple]:
+        """
+        Decodes a drained batch of pubsub messages and drops partial transcript
+        events that are superseded by a later event for the same message_id.
+        """
+        decoded = []
+        for message in batch:
+            data = message.get("data")
+            if not data:
+                continue
+            try:
+                parsed = orjson.loads(data)
+            except orjson.JSONDecodeError:
+                continue
+            decoded.append((message.get("type"), parsed))
+
+        kept = []
+        seen_message_ids = set()
+        for msg_type, parsed in reversed(decoded):
+            if msg_type == "pmessage":
+                payload = parsed.get("payload")
+                if isinstance(payload, dict) and payload.get("message_id"):
+                    key = (parsed.get("session_id"), payload["message_id"])
+                    if payload.get("type") == "partial" and key in seen_message_ids:
+                        continue
+                    seen_message_ids.add(key)
+            kept.append((msg_type, parsed))
+        kept.reverse()
+        return kept
+
+    async def _handle_session_event(self, parsed: Dict[str, Any]):
+        sender_instance = parsed.get("sender_instance")
+        if sender_instance == self._instance_id:
+            return
+        session_id = parsed.get("session_id")
+        payload = parsed.get("payload")
+        if not session_id or not isinstance(payload, dict):
+            return
+
+        await self._send_to_local_viewers(session_id, payload)
+        if (
+            payload.get("type") == "status"
+            and payload.get("status") == "active"
+            and session_id in self.sessions
+        ):
+            # Persist attendees for local waiting viewers when another
+            # instance activates this session.
+            local_users = {
+                self.socket_users.get(ws)
+                for ws in self.sessions[session_id]
+                if self.socket_users.get(ws)
+            }
+            for user_id in local_users:
+                asyncio.create_task(self._record_attendee(session_id, user_id))
+
+            requested = set()
+            for ws in self.sessions[session_id]:
+                lang = self.socket_languages.get(ws)
+                if lang and lang != "two_way":
+                    requested.add(lang)
+            for lang in requested:
+                await self._publish_control_to_owner(
+                    session_id, "language_request", lang
+                )
 
     async def _pubsub_loop(self):
         pubsub = self._redis.pubsub()
@@ -257,53 +356,22 @@ class ConnectionManager:
                     await asyncio.sleep(0.05)
                     continue
 
-                msg_type = message.get("type")
-                data = message.get("data")
-                if not data:
-                    continue
-
-                try:
-                    parsed = json.loads(data)
-                except json.JSONDecodeError:
-                    continue
-
-                if msg_type == "pmessage":
-                    sender_instance = parsed.get("sender_instance")
-                    if sender_instance == self._instance_id:
-                        continue
-                    session_id = parsed.get("session_id")
-                    payload = parsed.get("payload")
-                    if session_id and isinstance(payload, dict):
-                        await self._send_to_local_viewers(session_id, payload)
-                        if (
-                            payload.get("type") == "status"
-                            and payload.get("status") == "active"
-                            and session_id in self.sessions
-                        ):
-                            # Persist attendees for local waiting viewers when another
-                            # instance activates this session.
-                            local_users = {
-                                self.socket_users.get(ws)
-                                for ws in self.sessions[session_id]
-                                if self.socket_users.get(ws)
-                            }
-                            for user_id in local_users:
-                                asyncio.create_task(
-                                    self._record_attendee(session_id, user_id)
-                                )
-
-                            requested = set()
-                            for ws in self.sessions[session_id]:
-                                lang = self.socket_languages.get(ws)
-                                if lang and lang != "two_way":
-                                    requested.add(lang)
-                            for lang in requested:
-                                await self._publish_control_to_owner(
-                                    session_id, "language_request", lang
-                                )
-
-                elif msg_type == "message":
-                    await self._handle_control_message(parsed)
+                # Drain whatever else is already buffered so a burst of events is
+                # handled in one pass instead of one loop iteration per message.
+                batch = [message]
+                while len(batch) < PUBSUB_DRAIN_LIMIT:
+                    pending = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=0
+                    )
+                    if not pending:
+                        break
+                    batch.append(pending)
+
+                for msg_type, parsed in self._coalesce_pubsub_batch(batch):
+                    if msg_type == "pmessage":
+                        await self._handle_session_event(parsed)
+                    elif msg_type == "message":
+                        await self._handle_control_message(parsed)
         except asyncio.CancelledError:
             with log_step("CONN-MANAGER"):
                 logger.info("Redis pubsub loop cancelled.")
@@ -327,13 +395,12 @@ class ConnectionManager:
             return
 
         channel = f"{self._redis_prefix}:control:{owner_instance}"
-        payload = json.dumps(
+        payload = orjson.dumps(
             {
                 "session_id": session_id,
                 "command": command,
                 "language_code": language_code,
-            },
-            separators=(",", ":"),
+            }
         )
         await self._redis.publish(channel, payload)
 
@@ -373,9 +440,9 @@ class ConnectionManager:
                 old_connections = self.sessions.pop(old_session_id)
 
                 if new_session_id not in self.sessions:
-                    self.sessions[new_session_id] = []
+                    self.sessions[new_session_id] = set()
 
-                self.sessions[new_session_id].extend(old_connections)
+                self.sessions[new_session_id].update(old_connections)
 
                 for ws in old_connections:
                     if ws in self.socket_users:
@@ -452,8 +519,8 @@ class ConnectionManager:
 
         try:
             if session_id not in self.sessions:
-                self.sessions[session_id] = []
-            self.sessions[session_id].append(websocket)
+                self.sessions[session_id] = set()
+            self.sessions[session_id].add(websocket)
 
             session_meta = await self.get_session_metadata_global(session_id)
             is_shared_two_way_mode = bool(session_meta.get("shared_two_way_mode"))
@@ -476,7 +543,9 @@ class ConnectionManager:
                     )
                 asyncio.create_task(self._record_attendee(session_id, user_id))
 
-            history = await self.cache.get_history(session_id, effective_language)
+            # Replay the stored JSON strings directly instead of decoding and
+            # re-encoding every cached message for each new viewer.
+            history = await self.cache.get_history_raw(session_id, effective_language)
 
             with log_step("CONN-MANAGER"):
                 logger.debug(
@@ -484,13 +553,12 @@ class ConnectionManager:
                     f"Replaying {len(history)} cached messages."
                 )
 
-            if history:
-                for payload in history:
-                    await websocket.send_json(payload)
+            for raw_payload in history:
+                await websocket.send_text(raw_payload)
 
             total_count = len(self.sessions[session_id])
             language_counts = {}
-            for ws in self.sessions.get(session_id, []):
+            for ws in self.sessions.get(session_id, ()):
                 lang = self.socket_languages.get(ws, "unknown")
                 language_counts[lang] = language_counts.get(lang, 0) + 1
 
@@ -520,12 +588,11 @@ class ConnectionManager:
                 del self.socket_users[websocket]
 
             if session_id in self.sessions:
-                if websocket in self.sessions[session_id]:
-                    self.sessions[session_id].remove(websocket)
+                self.sessions[session_id].discard(websocket)
                 if not self.sessions[session_id]:
                     del self.sessions[session_id]
 
-            total_count = len(self.sessions.get(session_id, []))
+            total_count = len(self.sessions.get(session_id, ()))
             lang_count = 0
             if language_code:
                 lang_count = self.get_viewer_count(session_id, language_code)
@@ -538,7 +605,7 @@ class ConnectionManager:
                     )
                 return
 
-            total_count = len(self.sessions.get(session_id, []))
+            total_count = len(self.sessions.get(session_id, ()))
             lang_count = 0
             if language_code:
                 lang_count = self.get_viewer_count(session_id, language_code)
@@ -591,15 +658,18 @@ class ConnectionManager:
 
         if payload.get("message_id") and effective_payload_lang:
             await self.cache.process_message(session_id, effective_payload_lang, payload)
-        await self._send_to_local_viewers(session_id, payload)
 
-        envelope = json.dumps(
+        # Serialized once: local viewers get these bytes and the pubsub
+        # envelope embeds them as-is instead of re-encoding the payload.
+        encoded_payload = orjson.dumps(payload)
+        await self._send_to_local_viewers(session_id, payload, encoded_payload)
+
+        envelope = orjson.dumps(
             {
                 "session_id": session_id,
                 "sender_instance": self._instance_id,
-                "payload": payload,
-            },
-            separators=(",", ":"),
+                "payload": orjson.Fragment(encoded_payload),
+            }
         )
         await self._redis.publish(self._session_events_channel(session_id), envelope)
 
@@ -648,7 +718,7 @@ class ConnectionManager:
             # Once this session flips to active, persist those users as attendees.
             waiting_users = {
                 self.socket_users.get(ws)
-                for ws in self.sessions.get(session_id, [])
+                for ws in self.sessions.get(session_id, ())
                 if self.socket_users.get(ws)
             }
             for user_id in waiting_users:
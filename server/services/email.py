@@ -318,3 +318,15 @@ class EmailService:
             if tasks:
                 await asyncio.gather(*tasks)
                 logger.info(f"Finished sending {len(tasks)} emails.")
+
+
+# One MSAL app per process keeps its in-memory token cache between sessions,
+# so attendee emails reuse the Graph token instead of fetching a new one.
+_shared_email_service: EmailService | None = None
+
+
+def get_email_service() -> EmailService:
+    global _shared_email_service
+    if _shared_email_service is None:
+        _shared_email_service = EmailService()
+    return _shared_email_service
@@ -1,11 +1,12 @@
 import asyncio
-import base64
-import json
+import binascii
 import logging
+import time
 import uuid
 from datetime import datetime
 from typing import Dict, Optional, List
 
+import orjson
 from core.config import settings
 from core.db import AsyncSessionLocal
 from core.logging_setup import (
@@ -23,7 +24,7 @@ from redis import asyncio as aioredis
 from sqlalchemy import select, update
 
 from .backfill import BackfillService
-from .email import EmailService
+from .email import get_email_service
 from .soniox import (
     SonioxConnectionError,
     SonioxError,
@@ -37,6 +38,13 @@ from .vtt import TimestampService
 logger = logging.getLogger(__name__)
 
 ACTIVE_SESSIONS: Dict[str, "MeetingSession"] = {}
+# Partial results arriving faster than this (with little new text) are held
+# and flushed as the latest one, so viewers see at most ~30 updates a second.
+PARTIAL_BROADCAST_INTERVAL_SECONDS = 1 / 30
+PARTIAL_BROADCAST_MIN_CHARS = 32
+# A partial that ends a sentence skips the wait so viewers read whole sentences
+# as soon as they are recognized.
+SENTENCE_END_CHARS = (".", "!", "?", "\u3002", "\uff01", "\uff1f")
 SESSION_LOCK = asyncio.Lock()
 RECEIVER_REDIS = aioredis.from_url(
     settings.REDIS_URL, encoding="utf-8", decode_responses=True
@@ -172,6 +180,14 @@ class StreamHandler:
         self.current_speaker = "Unknown"
         self.current_message_id = None
 
+        self._last_partial_sent_at = 0.0
+        self._last_partial_sent_len = 0
+        self._last_partial_key: Optional[tuple] = None
+        self._pending_partial: Optional[dict] = None
+        self._partial_broadcast_task: Optional[asyncio.Task] = None
+        self._held_partial: Optional[dict] = None
+        self._held_partial_timer: Optional[asyncio.TimerHandle] = None
+
         self.timestamp_service = TimestampService(start_time=session_start_time)
         self.connect_time = None
 
@@ -246,6 +262,86 @@ class StreamHandler:
                 f"Transcription service ({self.language_code}) closed. Code: {code}, Reason: {reason}"
             )
 
+    def _should_broadcast_partial(self, result: SonioxResult) -> bool:
+        """
+        Coalesces bursts of partial results: a partial goes out once the
+        broadcast interval has elapsed, enough new text has accumulated, or
+        its text ends a sentence.
+        """
+        now = time.monotonic()
+        text_len = len(result.transcription or "") + len(result.translation or "")
+        ends_sentence = (result.translation or result.transcription or "").endswith(
+            SENTENCE_END_CHARS
+        )
+        if (
+            not ends_sentence
+            and now - self._last_partial_sent_at < PARTIAL_BROADCAST_INTERVAL_SECONDS
+            and text_len - self._last_partial_sent_len < PARTIAL_BROADCAST_MIN_CHARS
+        ):
+            return False
+        self._last_partial_sent_at = now
+        self._last_partial_sent_len = text_len
+        return True
+
+    def _hold_partial(self, payload: dict):
+        """
+        Keeps a throttled partial and sends it once the broadcast interval
+        ends, so the latest text still reaches viewers if the stream pauses.
+        """
+        self._held_partial = payload
+        if self._held_partial_timer is None:
+            delay = max(
+                0.0,
+                self._last_partial_sent_at
+                + PARTIAL_BROADCAST_INTERVAL_SECONDS
+                - time.monotonic(),
+            )
+            self._held_partial_timer = asyncio.get_running_loop().call_later(
+                delay, self._release_held_partial
+            )
+
+    def _release_held_partial(self):
+        self._held_partial_timer = None
+        payload, self._held_partial = self._held_partial, None
+        self._last_partial_sent_at = time.monotonic()
+        self._last_partial_sent_len = len(payload["transcription"] or "") + len(
+            payload["translation"] or ""
+        )
+        self._queue_partial_broadcast(payload)
+
+    def _drop_held_partial(self):
+        self._held_partial = None
+        if self._held_partial_timer is not None:
+            self._held_partial_timer.cancel()
+            self._held_partial_timer = None
+
+    def _queue_partial_broadcast(self, payload: dict):
+        """
+        Hands a partial off to the background sender. If a send is already in
+        flight, the queued partial is replaced so viewers only get the newest.
+        """
+        self._pending_partial = payload
+        if self._partial_broadcast_task is None or self._partial_broadcast_task.done():
+            self._partial_broadcast_task = asyncio.create_task(
+                self._send_pending_partials()
+            )
+
+    async def _send_pending_partials(self):
+        while self._pending_partial is not None:
+            payload, self._pending_partial = self._pending_partial, None
+            try:
+                await self.viewer_manager.broadcast_to_session(self.session_id, payload)
+            except Exception as e:
+                logger.error(
+                    f"Failed to broadcast partial ({self.language_code}): {e}"
+                )
+
+    async def _finish_partial_broadcasts(self):
+        """Drops any queued partial and waits for the one being sent, if any."""
+        self._pending_partial = None
+        if self._partial_broadcast_task and not self._partial_broadcast_task.done():
+            await self._partial_broadcast_task
+
     async def _on_transcription_message(self, result: SonioxResult):
         await self.stream_ready.wait()
 
@@ -257,8 +353,10 @@ class StreamHandler:
                 if result.is_final:
                     with log_step("SESSION"):
                         logger.debug(
-                            f"Stream {self.language_code} finished skipping mid-utterance. "
-                            f"Now synced. Next ID will be #{self.utterance_count + 1}."
+                            "Stream %s finished skipping mid-utterance. "
+                            "Now synced. Next ID will be #%d.",
+                            self.language_code,
+                            self.utterance_count + 1,
                         )
                     self.await_next_utterance = False
                     self.is_new_utterance = True
@@ -276,7 +374,7 @@ class StreamHandler:
                 message_id_var.set(self.current_message_id)
                 with log_step("UTTERANCE"):
                     logger.debug(
-                        f"Starting pipeline for utterance ({self.language_code})."
+                        "Starting pipeline for utterance (%s).", self.language_code
                     )
 
             if not self.current_message_id:
@@ -284,10 +382,6 @@ class StreamHandler:
                     self.is_new_utterance = True
                 return
 
-            has_text = (result.transcription and result.transcription.strip()) or (
-                result.translation and result.translation.strip()
-            )
-
             if has_text:
                 payload_type = "final" if result.is_final else "partial"
 
@@ -306,6 +400,18 @@ class StreamHandler:
                     result.speaker if result.speaker else self.current_speaker
                 )
 
+                if payload_type == "partial":
+                    # Soniox can emit a result whose text matches the previous
+                    # partial; viewers already have it, so skip the send.
+                    partial_key = (
+                        result.transcription,
+                        result.translation,
+                        final_speaker_name,
+                    )
+                    if partial_key == self._last_partial_key:
+                        return
+                    self._last_partial_key = partial_key
+
                 payload = {
                     "message_id": self.current_message_id,
                     "transcription": result.transcription,
@@ -317,16 +423,31 @@ class StreamHandler:
                     "isfinalize": result.is_final,
                     "vtt_timestamp": vtt_timestamp,
                 }
-                await self.viewer_manager.broadcast_to_session(self.session_id, payload)
+                if payload_type == "partial":
+                    if self._should_broadcast_partial(result):
+                        self._drop_held_partial()
+                        self._queue_partial_broadcast(payload)
+                    else:
+                        self._hold_partial(payload)
+                else:
+                    self._drop_held_partial()
+                    await self._finish_partial_broadcasts()
+                    await self.viewer_manager.broadcast_to_session(
+                        self.session_id, payload
+                    )
 
             if result.is_final:
                 with log_step("UTTERANCE"):
                     logger.debug(
-                        f"Finished pipeline for utterance ({self.language_code})."
+                        "Finished pipeline for utterance (%s).", self.language_code
                     )
 
+                self._drop_held_partial()
                 self.is_new_utterance = True
                 self.current_message_id = None
+                self._last_partial_sent_at = 0.0
+                self._last_partial_sent_len = 0
+                self._last_partial_key = None
                 message_id_var.set(None)
 
         finally:
@@ -358,6 +479,7 @@ class StreamHandler:
             await self.service.send_json({"type": "keepalive"})
 
     async def close(self):
+        self._drop_held_partial()
         if self.service:
             await self.service.finalize_stream()
             if self.service.receive_task:
@@ -365,6 +487,10 @@ class StreamHandler:
                     await asyncio.wait_for(self.service.receive_task, timeout=2.0)
                 except (asyncio.TimeoutError, Exception):
                     pass
+        # The receive loop may have handed over more partials while finishing;
+        # none of them should reach viewers once the stream is closed.
+        self._drop_held_partial()
+        await self._finish_partial_broadcasts()
 
 
 class MeetingSession:
@@ -623,7 +749,13 @@ class MeetingSession:
 
         for handler in handlers:
             handler.update_speaker(speaker)
-            await handler.send_audio(audio_chunk)
+
+        # Language streams have independent Soniox sockets, so one slow send
+        # should not delay the chunk for the others.
+        if len(handlers) == 1:
+            await handlers[0].send_audio(audio_chunk)
+        else:
+            await asyncio.gather(*(h.send_audio(audio_chunk) for h in handlers))
 
     async def close_session(self):
         """Performs final cleanup and database updates."""
@@ -715,7 +847,7 @@ class MeetingSession:
                 and meeting_details.translation_type == "two_way"
             )
 
-            email_service = EmailService()
+            email_service = get_email_service()
             await email_service.send_session_transcripts(
                 session_id=self.session_id,
                 integration=platform,
@@ -840,47 +972,64 @@ async def handle_receiver_session(
                 await meeting_session.initialize()
                 ACTIVE_SESSIONS[session_id] = meeting_session
 
+        current_speaker = "Unknown"
         while True:
-            raw_message = await websocket.receive_text()
-            message = json.loads(raw_message)
-
-            if "type" in message:
-                msg_type = message["type"]
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(frame.get("code", 1000))
+
+            # Binary frames are raw PCM from the last named speaker; text frames
+            # carry control messages and, from older clients, base64 audio.
+            audio_chunk = frame.get("bytes")
+            if audio_chunk is None:
+                message = orjson.loads(frame["text"])
+
+                if "type" in message:
+                    msg_type = message["type"]
+
+                    if msg_type == "session_start":
+                        new_zero_point = datetime.now()
+                        logger.info(
+                            f"Received session_start. Resetting session zero point to {new_zero_point}."
+                        )
 
-                if msg_type == "session_start":
-                    new_zero_point = datetime.now()
-                    logger.info(
-                        f"Received session_start. Resetting session zero point to {new_zero_point}."
-                    )
+                        try:
+                            async with AsyncSessionLocal() as session:
+                                await session.execute(
+                                    update(Meeting)
+                                    .where(Meeting.id == session_id)
+                                    .values(started_at=new_zero_point)
+                                )
+                                await session.commit()
+                            meeting_session.db_start_written = True
+                        except Exception as e:
+                            logger.error(f"Failed to update meeting start time: {e}")
+
+                        meeting_session.update_start_time(new_zero_point)
+                        continue
+
+                    elif msg_type == "session_reconnected":
+                        logger.info(
+                            "Received session_reconnected. Resuming without time reset."
+                        )
+                        continue
 
-                    try:
-                        async with AsyncSessionLocal() as session:
-                            await session.execute(
-                                update(Meeting)
-                                .where(Meeting.id == session_id)
-                                .values(started_at=new_zero_point)
-                            )
-                            await session.commit()
-                        meeting_session.db_start_written = True
-                    except Exception as e:
-                        logger.error(f"Failed to update meeting start time: {e}")
+                    elif msg_type == "session_end":
+                        logger.info(
+                            "Received session_end. Closing connection gracefully."
+                        )
+                        graceful_exit = True
+                        break
 
-                    meeting_session.update_start_time(new_zero_point)
-                    continue
+                if "userName" in message:
+                    current_speaker = message["userName"]
 
-                elif msg_type == "session_reconnected":
-                    logger.info(
-                        "Received session_reconnected. Resuming without time reset."
-                    )
+                audio_b64 = message.get("audio")
+                if not audio_b64:
                     continue
+                audio_chunk = binascii.a2b_base64(audio_b64)
 
-                elif msg_type == "session_end":
-                    logger.info("Received session_end. Closing connection gracefully.")
-                    graceful_exit = True
-                    break
-
-            audio_b64 = message.get("audio")
-            if not audio_b64:
+            if not audio_chunk:
                 continue
 
             if not meeting_session.db_start_written:
@@ -900,10 +1049,7 @@ async def handle_receiver_session(
                 except Exception as e:
                     logger.error(f"Failed to update meeting start time (fallback): {e}")
 
-            current_speaker = message.get("userName", "Unknown")
             speaker_var.set(current_speaker)
-            audio_chunk = base64.b64decode(audio_b64)
-
             await meeting_session.dispatch_audio(current_speaker, audio_chunk)
 
     except WebSocketDisconnect:
@@ -1,9 +1,9 @@
 import asyncio
-import json
 import logging
 from dataclasses import dataclass
 from typing import Awaitable, Callable, Optional, List
 
+import orjson
 import websockets
 from core.config import settings
 from core.logging_setup import log_step, session_id_var, speaker_var
@@ -36,7 +36,19 @@ class SonioxFatalError(SonioxError):
     pass
 
 
-@dataclass
+def _combine_text(final_text: str, non_final_text: str) -> str:
+    """
+    Joins the finalized and in-flight text of an utterance, skipping the
+    intermediate copy when one side is empty (the common case).
+    """
+    if not non_final_text:
+        return final_text.strip()
+    if not final_text:
+        return non_final_text.strip()
+    return f"{final_text} {non_final_text}".strip()
+
+
+@dataclass(slots=True)
 class SonioxResult:
     """
     Holds the consolidated transcription and translation from a Soniox message.
@@ -87,8 +99,10 @@ class SonioxService:
         self._is_connected = False
         self.SONIOX_WEBSOCKET_URL = "wss://stt-rt.soniox.com/transcribe-websocket"
 
-        self.final_transcription_tokens = []
-        self.final_translation_tokens = []
+        # Finalized text for the current utterance, extended only when new
+        # final tokens arrive instead of re-joining every token per message.
+        self.final_transcription_text = ""
+        self.final_translation_text = ""
 
         self.final_source_language: Optional[str] = None
         self.final_translation_language: Optional[str] = None
@@ -152,7 +166,7 @@ class SonioxService:
                     spk_token = speaker_var.set(self.current_speaker)
 
                 try:
-                    res = json.loads(message)
+                    res = orjson.loads(message)
 
                     if res.get("error_code") is not None:
                         error_msg = f"{res['error_code']} - {res['error_message']}"
@@ -162,6 +176,8 @@ class SonioxService:
                         await self.on_error_callback(SonioxConnectionError(error_msg))
                         break
 
+                    new_final_transcription_tokens = []
+                    new_final_translation_tokens = []
                     non_final_transcription_tokens = []
                     non_final_translation_tokens = []
                     is_end_token = False
@@ -170,12 +186,13 @@ class SonioxService:
                     non_final_target_lang: Optional[str] = None
                     non_final_speaker: Optional[str] = None
 
-                    for token in res.get("tokens", []):
+                    for token in res.get("tokens", ()):
                         text = token.get("text")
                         if not text:
                             continue
 
-                        if text == "<end>" and token.get("is_final"):
+                        is_final_token = token.get("is_final")
+                        if is_final_token and text == "<end>":
                             is_end_token = True
                             continue
 
@@ -188,13 +205,13 @@ class SonioxService:
                         if spk is not None and self.enable_speaker_diarization:
                             spk = f"Speaker {spk}"
 
-                        if token.get("is_final"):
+                        if is_final_token:
                             if is_translation:
-                                self.final_translation_tokens.append(text)
+                                new_final_translation_tokens.append(text)
                                 if not self.final_translation_language and lang:
                                     self.final_translation_language = lang
                             else:
-                                self.final_transcription_tokens.append(text)
+                                new_final_transcription_tokens.append(text)
                                 if not self.final_source_language and lang:
                                     self.final_source_language = lang
                                 if spk:
@@ -231,16 +248,22 @@ class SonioxService:
                                 ):
                                     self.utterance_end_ms = normalized_end_ms
 
-                    final_transcription = "".join(self.final_transcription_tokens)
-                    non_final_transcription = "".join(non_final_transcription_tokens)
-                    full_transcription = (
-                        f"{final_transcription} {non_final_transcription}".strip()
-                    )
+                    if new_final_transcription_tokens:
+                        self.final_transcription_text += "".join(
+                            new_final_transcription_tokens
+                        )
+                    if new_final_translation_tokens:
+                        self.final_translation_text += "".join(
+                            new_final_translation_tokens
+                        )
 
-                    final_translation = "".join(self.final_translation_tokens)
-                    non_final_translation = "".join(non_final_translation_tokens)
-                    full_translation = (
-                        f"{final_translation} {non_final_translation}".strip()
+                    full_transcription = _combine_text(
+                        self.final_transcription_text,
+                        "".join(non_final_transcription_tokens),
+                    )
+                    full_translation = _combine_text(
+                        self.final_translation_text,
+                        "".join(non_final_translation_tokens),
                     )
 
                     source_lang_to_send = (
@@ -281,12 +304,8 @@ class SonioxService:
 
                         await self.on_message_callback(
                             SonioxResult(
-                                transcription="".join(
-                                    self.final_transcription_tokens
-                                ).strip(),
-                                translation="".join(
-                                    self.final_translation_tokens
-                                ).strip(),
+                                transcription=self.final_transcription_text.strip(),
+                                translation=self.final_translation_text.strip(),
                                 is_final=True,
                                 source_language=final_source_lang,
                                 target_language=final_target_lang,
@@ -295,8 +314,8 @@ class SonioxService:
                                 end_ms=self.utterance_end_ms,
                             )
                         )
-                        self.final_transcription_tokens = []
-                        self.final_translation_tokens = []
+                        self.final_transcription_text = ""
+                        self.final_translation_text = ""
                         self.final_source_language = None
                         self.final_translation_language = None
                         self.final_speaker = None
@@ -308,12 +327,8 @@ class SonioxService:
                             logger.debug("Soniox signaled session finished.")
                         await self.on_message_callback(
                             SonioxResult(
-                                transcription="".join(
-                                    self.final_transcription_tokens
-                                ).strip(),
-                                translation="".join(
-                                    self.final_translation_tokens
-                                ).strip(),
+                                transcription=self.final_transcription_text.strip(),
+                                translation=self.final_translation_text.strip(),
                                 is_final=True,
                                 source_language=self.final_source_language,
                                 target_language=self.final_translation_language
@@ -333,8 +348,8 @@ class SonioxService:
                 logger.debug("Soniox connection closed normally.")
             await self.on_message_callback(
                 SonioxResult(
-                    transcription="".join(self.final_transcription_tokens).strip(),
-                    translation="".join(self.final_translation_tokens).strip(),
+                    transcription=self.final_transcription_text.strip(),
+                    translation=self.final_translation_text.strip(),
                     is_final=True,
                     source_language=self.final_source_language,
                     target_language=self.final_translation_language
@@ -381,7 +396,7 @@ class SonioxService:
                 ping_interval=20,
                 ping_timeout=10,
             )
-            await self.ws.send(json.dumps(config))
+            await self.ws.send(orjson.dumps(config).decode("utf-8"))
             self._is_connected = True
             self.receive_task = self.loop.create_task(self._receive_loop())
             with log_step("SONIOX"):
@@ -414,7 +429,8 @@ class SonioxService:
         """Helper to send JSON control messages (like keepalives)."""
         if self.ws and self._is_connected:
             try:
-                await self.ws.send(json.dumps(data))
+                # Sent as a text frame: Soniox treats binary frames as audio.
+                await self.ws.send(orjson.dumps(data).decode("utf-8"))
             except ConnectionClosedOK:
                 self._is_connected = False
                 with log_step("SONIOX"):
@@ -3,6 +3,7 @@ import logging
 import os
 import urllib.parse
 
+import httpx
 import ollama
 from core.config import settings
 from core.db import AsyncSessionLocal
@@ -18,11 +19,27 @@ logger = logging.getLogger(__name__)
 LOG_STEP = "SUMMARY"
 SUMMARY_CONCURRENCY = 3
 
+# Kept free of per-language details so every summary request for a session
+# shares the same system prompt + transcript prefix, letting Ollama reuse the
+# evaluated prompt instead of re-processing the transcript for each language.
+SUMMARY_SYSTEM_PROMPT = (
+    "Your task is to analyze the provided meeting transcript and generate a structured summary.\n\n"
+    "Do NOT include timestamps or preamble. Your job is to only provide the summary in the target language."
+)
+
 
 class SummaryService:
     def __init__(self):
         with log_step(LOG_STEP):
-            client_kwargs = {"host": settings.OLLAMA_BASE_URL}
+            # One pooled client per service, sized to the concurrency cap, so
+            # parallel per-language summaries reuse warm keep-alive connections.
+            client_kwargs = {
+                "host": settings.OLLAMA_BASE_URL,
+                "limits": httpx.Limits(
+                    max_connections=SUMMARY_CONCURRENCY,
+                    max_keepalive_connections=SUMMARY_CONCURRENCY,
+                ),
+            }
 
             if settings.OLLAMA_API_KEY and settings.OLLAMA_API_KEY.strip():
                 client_kwargs["headers"] = {
@@ -59,12 +76,9 @@ class SummaryService:
             if not line or line == "WEBVTT":
                 continue
                 
-            if "-->" in line:
-                try:
-                    start_time = line.split("-->")[0].strip()
-                    current_timestamp = start_time.split(".")[0]
-                except Exception:
-                    pass
+            start_time, arrow, _ = line.partition("-->")
+            if arrow:
+                current_timestamp = start_time.strip().partition(".")[0]
                 continue
             
             if line.isdigit():
@@ -72,10 +86,8 @@ class SummaryService:
 
             time_prefix = f"*{current_timestamp}* - " if current_timestamp else ""
 
-            if ": " in line:
-                parts = line.split(": ", 1)
-                speaker = parts[0]
-                text = parts[1]
+            speaker, separator, text = line.partition(": ")
+            if separator:
                 formatted_lines.append(f"{time_prefix}**{speaker}:** {text}")
             else:
                 formatted_lines.append(f"{time_prefix}{line}")
@@ -93,21 +105,19 @@ class SummaryService:
                         f"Generating {target_lang} summary for session {session_id} using {self.model}..."
                     )
 
-                    system_prompt = (
-                        f"Your task is to analyze the provided meeting transcript and generate a structured summary corresponding to this language code '{target_lang}'.\n\n"
-                        "Do NOT include timestamps or preamble. Your job is to only provide the summary in the target language."
-                    )
-
                     response = await self.client.chat(
                         model=self.model,
                         messages=[
                             {
                                 "role": "system",
-                                "content": system_prompt,
+                                "content": SUMMARY_SYSTEM_PROMPT,
                             },
                             {
                                 "role": "user",
-                                "content": f"TRANSCRIPT:\n{source_text}",
+                                "content": (
+                                    f"TRANSCRIPT:\n{source_text}\n\n"
+                                    f"Target language code: '{target_lang}'."
+                                ),
                             },
                         ],
                     )
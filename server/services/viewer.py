@@ -133,8 +133,12 @@ async def handle_viewer_session(
                 }
             )
 
+            # Viewers never send data, so only wait for the disconnect frame
+            # rather than decoding whatever the client happens to send.
             while True:
-                await websocket.receive_text()
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(message.get("code", 1000))
 
     except WebSocketDisconnect:
         with log_step("WEBSOCKET"):
@@ -57,7 +57,7 @@ class TimestampService:
             token = message_id_var.set(message_id)
             try:
                 with log_step("TIMESTAMP"):
-                    logger.debug(f"Marked start for utterance: {message_id}")
+                    logger.debug("Marked start for utterance: %s", message_id)
             finally:
                 message_id_var.reset(token)
 
@@ -71,6 +71,7 @@ class TimestampService:
         try:
             with log_step("TIMESTAMP"):
                 start_offset_ms = self._utterance_start_offsets_ms.pop(message_id, None)
+                utterance_start_time = self._utterance_start_times.pop(message_id, None)
 
                 if start_offset_ms is not None:
                     normalized_end_ms = start_offset_ms
@@ -81,7 +82,6 @@ class TimestampService:
                     end_delta = timedelta(milliseconds=normalized_end_ms)
                 else:
                     utterance_end_time = datetime.now()
-                    utterance_start_time = self._utterance_start_times.pop(message_id, None)
 
                     if not utterance_start_time:
                         utterance_start_time = utterance_end_time
@@ -101,7 +101,7 @@ class TimestampService:
                 vtt_timestamp = f"{start_str} --> {end_str}"
 
                 logger.debug(
-                    f"Completed utterance '{message_id}'. Timestamp: {vtt_timestamp}"
+                    "Completed utterance '%s'. Timestamp: %s", message_id, vtt_timestamp
                 )
 
                 return vtt_timestamp
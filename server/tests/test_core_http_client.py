@@ -14,8 +14,9 @@ class _FakeAsyncClient:
 def test_get_http_client_reuses_singleton(monkeypatch):
     created = []
 
-    def factory():
+    def factory(**kwargs):
         client = _FakeAsyncClient()
+        client.kwargs = kwargs
         created.append(client)
         return client
 
@@ -27,14 +28,16 @@ def test_get_http_client_reuses_singleton(monkeypatch):
 
     assert first is second
     assert len(created) == 1
+    assert created[0].kwargs["limits"] is http_client.HTTP_CLIENT_LIMITS
 
 
 @pytest.mark.asyncio
 async def test_init_and_close_http_client(monkeypatch):
     created = []
 
-    def factory():
+    def factory(**kwargs):
         client = _FakeAsyncClient()
+        client.kwargs = kwargs
         created.append(client)
         return client
 
@@ -72,4 +72,5 @@ async def test_init_orm_runs_create_all_and_post_statements(monkeypatch):
 
     await orm.init_orm()
     assert calls["create_all"] == 1
-    assert len(calls["statements"]) == 2
+    assert len(calls["statements"]) == 3
+    assert "pg_advisory_xact_lock" in calls["statements"][0]
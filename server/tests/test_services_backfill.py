@@ -9,8 +9,10 @@ from services import backfill
 class FakeCompletions:
     def __init__(self, outcomes):
         self.outcomes = list(outcomes)
+        self.requests = []
 
     async def create(self, **kwargs):
+        self.requests.append(kwargs)
         if not self.outcomes:
             raise RuntimeError("no outcome")
         nxt = self.outcomes.pop(0)
@@ -53,6 +55,26 @@ async def test_translate_text_success(svc):
     out = await svc._translate_text("hello", "en", "es")
     assert out == "translated"
 
+    request = svc.client.chat.completions.requests[0]
+    assert request["messages"] == [{"role": "user", "content": "hello"}]
+    assert request["extra_body"]["translation_options"] == {
+        "source_lang": "en",
+        "target_lang": "es",
+    }
+
+
+@pytest.mark.asyncio
+async def test_translate_text_reuses_cached_translation(monkeypatch, svc):
+    monkeypatch.setattr(backfill, "BACKFILL_CACHE_SIZE", 1)
+    svc.client = FakeClient(["hola", "adios"])
+
+    assert await svc._translate_text("hello", "en", "es") == "hola"
+    assert await svc._translate_text("hello", "en", "es") == "hola"
+    assert len(svc.client.chat.completions.requests) == 1
+
+    assert await svc._translate_text("bye", "en", "es") == "adios"
+    assert list(svc._translation_cache) == [("bye", "en", "es")]
+
 
 @pytest.mark.asyncio
 async def test_translate_text_unexpected_error_returns_empty(svc):
@@ -199,19 +221,107 @@ async def test_run_session_backfill_start_end_and_processing(monkeypatch, svc):
 
     calls = []
 
-    async def fake_process(item, session_id, target_lang, viewer_manager):
+    async def fake_translate(item, target_lang):
         calls.append(item["message_id"])
+        return {"message_id": "1_es", "type": "final"}
 
     monkeypatch.setattr(svc, "_fetch_or_wait_for_item", fake_fetch)
-    monkeypatch.setattr(svc, "_process_backfill_item", fake_process)
+    monkeypatch.setattr(svc, "_translate_backfill_item", fake_translate)
 
     await svc.run_session_backfill("s1", "es", vm, upto_count=2)
 
     assert vm.broadcasts[0][1]["type"] == "backfill_start"
+    assert vm.broadcasts[1][1]["message_id"] == "1_es"
     assert vm.broadcasts[-1][1]["type"] == "backfill_end"
     assert calls == ["1_en"]
 
 
+@pytest.mark.asyncio
+async def test_run_session_backfill_overlaps_translations_but_keeps_order(monkeypatch, svc):
+    vm = FakeViewerManager()
+    monkeypatch.setattr(backfill, "BACKFILL_TRANSLATION_WINDOW", 3)
+    active = {"now": 0, "peak": 0}
+
+    async def fake_fetch(session_id, message_id, viewer_manager):
+        return {"message_id": message_id, "type": "final", "isfinalize": True, "transcription": message_id}
+
+    async def fake_translate(text, source_lang, target_lang):
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        # Earlier utterances finish last to prove broadcasts stay ordered.
+        await asyncio.sleep(0.01 * (6 - int(text.split("_")[0])))
+        active["now"] -= 1
+        return "" if text == "4_en" else f"t{text}"
+
+    monkeypatch.setattr(svc, "_fetch_or_wait_for_item", fake_fetch)
+    monkeypatch.setattr(svc, "_translate_text", fake_translate)
+
+    await svc.run_session_backfill("s1", "es", vm, upto_count=5)
+
+    sent = [p["message_id"] for _, p in vm.broadcasts[1:-1]]
+    assert sent == ["1_es", "2_es", "3_es", "5_es"]
+    assert active["peak"] == 3
+
+
+@pytest.mark.asyncio
+async def test_run_session_backfill_sends_finished_results_before_waiting(monkeypatch, svc):
+    vm = FakeViewerManager()
+    sent_before_wait = {}
+
+    async def fake_fetch(session_id, message_id, viewer_manager):
+        sent_before_wait[message_id] = [p.get("message_id") for _, p in vm.broadcasts[1:]]
+        if message_id != "1_en":
+            await asyncio.sleep(0.01)
+        if message_id == "4_en":
+            return None
+        return {"message_id": message_id, "type": "final", "isfinalize": True, "transcription": "x"}
+
+    async def fake_translate(item, target_lang):
+        return {"message_id": item["message_id"].replace("_en", "_es"), "type": "final"}
+
+    monkeypatch.setattr(svc, "_fetch_or_wait_for_item", fake_fetch)
+    monkeypatch.setattr(svc, "_translate_backfill_item", fake_translate)
+
+    await svc.run_session_backfill("s1", "es", vm, upto_count=4)
+
+    assert sent_before_wait["3_en"] == ["1_es"]
+    assert sent_before_wait["4_en"] == ["1_es", "2_es"]
+    sent = [p["message_id"] for _, p in vm.broadcasts[1:-1]]
+    assert sent == ["1_es", "2_es", "3_es"]
+
+
+@pytest.mark.asyncio
+async def test_run_session_backfill_cancels_pending_translations(monkeypatch, svc):
+    vm = FakeViewerManager()
+    started = []
+
+    async def fake_fetch(session_id, message_id, viewer_manager):
+        if message_id == "2_en":
+            await asyncio.sleep(0)
+            raise RuntimeError("cache down")
+        return {"message_id": message_id, "type": "final", "isfinalize": True, "transcription": "x"}
+
+    cancelled = []
+
+    async def slow_translate(item, target_lang):
+        started.append(item["message_id"])
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(item["message_id"])
+            raise
+
+    monkeypatch.setattr(svc, "_fetch_or_wait_for_item", fake_fetch)
+    monkeypatch.setattr(svc, "_translate_backfill_item", slow_translate)
+
+    await svc.run_session_backfill("s1", "es", vm, upto_count=3)
+    await asyncio.sleep(0)
+
+    assert started == ["1_en"]
+    assert cancelled == ["1_en"]
+    assert all(item[1]["type"] != "backfill_end" for item in vm.broadcasts)
+
+
 @pytest.mark.asyncio
 async def test_run_session_backfill_handles_exception(monkeypatch, svc):
     vm = FakeViewerManager()
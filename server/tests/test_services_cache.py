@@ -182,6 +182,9 @@ async def test_cache_process_finalize_inserts_and_history(transcript_cache):
     assert len(history) == 1
     assert history[0]["message_id"] == "1_a"
 
+    raw_history = await transcript_cache.get_history_raw("s1", "en")
+    assert [json.loads(raw) for raw in raw_history] == history
+
 
 @pytest.mark.asyncio
 async def test_cache_process_ignores_blank_language_and_missing_message_id(transcript_cache):
@@ -206,6 +209,19 @@ async def test_cache_process_missing_nonfinal_is_ignored(transcript_cache):
     assert await transcript_cache.get_history("s1", "en") == []
 
 
+@pytest.mark.asyncio
+async def test_cache_process_partial_skips_redis_lookup(transcript_cache, monkeypatch):
+    async def fail_hget(*_args, **_kwargs):
+        raise AssertionError("partials should not be looked up")
+
+    monkeypatch.setattr(transcript_cache._redis, "hget", fail_hget)
+    payload = {"message_id": "1_a", "type": "partial", "isfinalize": False}
+    await transcript_cache.process_message("s1", "en", payload)
+
+    assert payload["speaker"] == "Backfill"
+    assert await transcript_cache.get_history("s1", "en") == []
+
+
 @pytest.mark.asyncio
 async def test_cache_process_correction_overwrites(transcript_cache):
     await transcript_cache.process_message("s1", "en", _final_message("1_a", "orig"))
@@ -259,6 +275,15 @@ async def test_cache_process_unknown_type_does_not_change_existing(transcript_ca
     assert msg_before == msg_after
 
 
+@pytest.mark.asyncio
+async def test_cache_process_repeated_final_keeps_first(transcript_cache):
+    await transcript_cache.process_message("s1", "en", _final_message("1_a", "orig"))
+    await transcript_cache.process_message("s1", "en", _final_message("1_a", "again"))
+
+    history = await transcript_cache.get_history("s1", "en")
+    assert [item["transcription"] for item in history] == ["orig"]
+
+
 @pytest.mark.asyncio
 async def test_cache_process_backfill_override_defaults_speaker(transcript_cache):
     await transcript_cache.process_message("s1", "en", _final_message("1_a", "orig"))
@@ -56,6 +56,9 @@ class FakeCache:
     async def get_history(self, session_id, language):
         return list(self.history.get((session_id, language), []))
 
+    async def get_history_raw(self, session_id, language):
+        return [json.dumps(item) for item in self.history.get((session_id, language), [])]
+
 
 class FakeWebSocket:
     def __init__(self):
@@ -64,6 +67,9 @@ class FakeWebSocket:
     async def send_json(self, payload):
         self.sent.append(payload)
 
+    async def send_text(self, text):
+        self.sent.append(json.loads(text))
+
 
 class FakeTask:
     def __init__(self):
@@ -101,7 +107,7 @@ async def test_global_active_sessions_filters_invalid_entries(monkeypatch):
     redis.exists_map[mgr._receiver_lease_key("s2")] = True
 
     ws = FakeWebSocket()
-    mgr.sessions["s1"] = [ws]
+    mgr.sessions["s1"] = {ws}
     mgr.socket_languages[ws] = "en"
 
     sessions = await mgr.get_global_active_sessions()
@@ -119,7 +125,7 @@ async def test_simple_client_helpers_and_waiting_languages(monkeypatch):
         "s1": {"integration": "zoom"},
         "s2": {"integration": "standalone"},
     }
-    mgr.sessions["s1"] = [ws]
+    mgr.sessions["s1"] = {ws}
     mgr.socket_languages[ws] = "es"
 
     all_clients = mgr.get_all_clients()
@@ -264,7 +270,7 @@ async def test_broadcast_to_session_processes_cache_and_publishes(monkeypatch):
     mgr, redis = build_manager(monkeypatch)
 
     ws = FakeWebSocket()
-    mgr.sessions["s1"] = [ws]
+    mgr.sessions["s1"] = {ws}
     mgr.socket_languages[ws] = "en"
 
     payload = {"message_id": "1", "target_language": "en", "text": "hi"}
@@ -273,6 +279,12 @@ async def test_broadcast_to_session_processes_cache_and_publishes(monkeypatch):
     assert mgr.cache.processed[0][1] == "en"
     assert ws.sent and ws.sent[0]["text"] == "hi"
     assert redis.published
+    channel, envelope = redis.published[-1]
+    assert json.loads(envelope) == {
+        "session_id": "s1",
+        "sender_instance": mgr._instance_id,
+        "payload": payload,
+    }
 
 
 @pytest.mark.asyncio
@@ -315,7 +327,7 @@ async def test_register_and_deregister_transcription_session(monkeypatch):
 async def test_register_transcription_session_records_waiting_users(monkeypatch):
     mgr, _ = build_manager(monkeypatch)
     ws = FakeWebSocket()
-    mgr.sessions["s1"] = [ws]
+    mgr.sessions["s1"] = {ws}
     mgr.socket_users[ws] = "u1"
     seen = []
 
@@ -373,7 +385,7 @@ async def test_send_to_local_viewers_filters_language_and_shared_mode(monkeypatc
     mgr, _ = build_manager(monkeypatch)
     en_ws = FakeWebSocket()
     es_ws = FakeWebSocket()
-    mgr.sessions["s1"] = [en_ws, es_ws]
+    mgr.sessions["s1"] = {en_ws, es_ws}
     mgr.socket_languages[en_ws] = "en"
     mgr.socket_languages[es_ws] = "es"
 
@@ -393,6 +405,82 @@ async def test_send_to_local_viewers_filters_language_and_shared_mode(monkeypatc
     assert len(es_ws.sent) == 1
 
 
+@pytest.mark.asyncio
+async def test_send_to_local_viewers_encodes_payload_once(monkeypatch):
+    mgr, _ = build_manager(monkeypatch)
+    frames = []
+
+    class RecordingWS(FakeWebSocket):
+        async def send_text(self, text):
+            frames.append(text)
+
+    viewers = [RecordingWS(), RecordingWS(), RecordingWS()]
+    mgr.sessions["s1"] = set(viewers)
+    for ws in viewers:
+        mgr.socket_languages[ws] = "en"
+
+    await mgr._send_to_local_viewers("s1", {"target_language": "en", "text": "olá"})
+
+    assert len(frames) == 3
+    assert all(frame is frames[0] for frame in frames)
+    assert json.loads(frames[0]) == {"target_language": "en", "text": "olá"}
+
+
+@pytest.mark.asyncio
+async def test_send_to_local_viewers_reaps_failed_and_stalled_viewers(monkeypatch):
+    mgr, _ = build_manager(monkeypatch)
+    monkeypatch.setattr(
+        "services.connection_manager.VIEWER_SEND_TIMEOUT_SECONDS", 0.01
+    )
+
+    class BrokenWS(FakeWebSocket):
+        def __init__(self):
+            super().__init__()
+            self.closed = None
+
+        async def send_text(self, text):
+            raise RuntimeError("gone")
+
+        async def close(self, code=1000, reason=None):
+            self.closed = code
+
+    class StalledWS(BrokenWS):
+        async def send_text(self, text):
+            await asyncio.sleep(1)
+
+    class UnclosableWS(FakeWebSocket):
+        async def send_text(self, text):
+            raise RuntimeError("gone")
+
+        async def close(self, code=1000, reason=None):
+            raise RuntimeError("already closed")
+
+    healthy = FakeWebSocket()
+    broken = BrokenWS()
+    stalled = StalledWS()
+    unclosable = UnclosableWS()
+    mgr.sessions["s1"] = {healthy, broken, stalled, unclosable}
+    for ws in (healthy, broken, stalled, unclosable):
+        mgr.socket_languages[ws] = "en"
+
+    async def inactive(_sid):
+        return False
+
+    async def meta(_sid):
+        return {}
+
+    monkeypatch.setattr(mgr, "is_session_active_global", inactive)
+    monkeypatch.setattr(mgr, "get_session_metadata_global", meta)
+
+    await mgr._send_to_local_viewers("s1", {"target_language": "en", "msg": 1})
+
+    assert healthy.sent == [{"target_language": "en", "msg": 1}]
+    assert mgr.sessions["s1"] == {healthy}
+    assert broken.closed == 1011
+    assert stalled.closed == 1011
+    assert broken not in mgr.socket_languages
+
+
 @pytest.mark.asyncio
 async def test_send_to_local_viewers_missing_session(monkeypatch):
     mgr, _ = build_manager(monkeypatch)
@@ -467,7 +555,7 @@ async def test_connect_shared_two_way_active_does_not_request_language(monkeypat
 async def test_disconnect_schedules_cleanup_for_non_english(monkeypatch):
     mgr, _ = build_manager(monkeypatch)
     ws = FakeWebSocket()
-    mgr.sessions["s1"] = [ws]
+    mgr.sessions["s1"] = {ws}
     mgr.socket_languages[ws] = "fr"
     mgr.socket_users[ws] = "u1"
 
@@ -497,7 +585,7 @@ async def test_disconnect_schedules_cleanup_for_non_english(monkeypatch):
 async def test_disconnect_inactive_session_returns_early(monkeypatch):
     mgr, _ = build_manager(monkeypatch)
     ws = FakeWebSocket()
-    mgr.sessions["s1"] = [ws]
+    mgr.sessions["s1"] = {ws}
     mgr.socket_languages[ws] = "fr"
 
     async def inactive(_sid):
@@ -508,11 +596,29 @@ async def test_disconnect_inactive_session_returns_early(monkeypatch):
     assert "s1" not in mgr.cleanup_tasks
 
 
+@pytest.mark.asyncio
+async def test_disconnect_twice_is_noop_and_keeps_other_viewers(monkeypatch):
+    mgr, _ = build_manager(monkeypatch)
+    ws = FakeWebSocket()
+    other = FakeWebSocket()
+    mgr.sessions["s1"] = {ws, other}
+    mgr.socket_languages[ws] = "en"
+    mgr.socket_languages[other] = "en"
+
+    async def inactive(_sid):
+        return False
+
+    monkeypatch.setattr(mgr, "is_session_active_global", inactive)
+    await mgr.disconnect(ws, "s1")
+    await mgr.disconnect(ws, "s1")
+    assert mgr.sessions["s1"] == {other}
+
+
 @pytest.mark.asyncio
 async def test_disconnect_cancels_existing_cleanup_task(monkeypatch):
     mgr, _ = build_manager(monkeypatch)
     ws = FakeWebSocket()
-    mgr.sessions["s1"] = [ws]
+    mgr.sessions["s1"] = {ws}
     mgr.socket_languages[ws] = "fr"
     old_task = FakeTask()
     mgr.cleanup_tasks["s1"] = {"fr": old_task}
@@ -587,7 +693,7 @@ async def test_cleanup_language_stream_inactive_and_cancelled(monkeypatch):
 async def test_migrate_session_moves_connections_and_records_attendees(monkeypatch):
     mgr, _ = build_manager(monkeypatch)
     ws = FakeWebSocket()
-    mgr.sessions["old"] = [ws]
+    mgr.sessions["old"] = {ws}
     mgr.socket_users[ws] = "u1"
     recorded = []
 
@@ -613,7 +719,7 @@ async def test_migrate_session_handles_send_error_and_outer_exception(monkeypatc
             raise RuntimeError("no send")
 
     ws = BadWS()
-    mgr.sessions["old"] = [ws]
+    mgr.sessions["old"] = {ws}
     mgr.socket_users[ws] = "u1"
     await mgr.migrate_session("old", "new")
 
@@ -624,7 +730,7 @@ async def test_migrate_session_handles_send_error_and_outer_exception(monkeypatc
         def pop(self, key):
             raise RuntimeError("explode")
 
-    mgr.sessions = ExplodingSessions({"new": [ws]})
+    mgr.sessions = ExplodingSessions({"new": {ws}})
     await mgr.migrate_session("new", "x")
 
 
@@ -668,7 +774,7 @@ async def test_record_attendee_success_and_error_paths(monkeypatch):
 async def test_pubsub_loop_processes_event_and_control_messages(monkeypatch):
     mgr, redis = build_manager(monkeypatch)
     ws = FakeWebSocket()
-    mgr.sessions["s1"] = [ws]
+    mgr.sessions["s1"] = {ws}
     mgr.socket_users[ws] = "u1"
     mgr.socket_languages[ws] = "es"
     sent = {"viewer": [], "control": [], "handle": []}
@@ -718,9 +824,11 @@ async def test_pubsub_loop_processes_event_and_control_messages(monkeypatch):
         async def subscribe(self, *_args):
             return None
 
-        async def get_message(self, **_kwargs):
+        async def get_message(self, **kwargs):
             if self.messages:
                 return self.messages.pop(0)
+            if kwargs.get("timeout") == 0:
+                return None
             raise asyncio.CancelledError()
 
         async def aclose(self):
@@ -754,6 +862,11 @@ async def test_pubsub_loop_ignores_empty_bad_json_same_sender_and_no_data(monkey
                 None,
                 {"type": "pmessage", "data": ""},
                 {"type": "pmessage", "data": "not-json"},
+                {"type": "pmessage", "data": json.dumps({"session_id": "s1"})},
+                {
+                    "type": "pmessage",
+                    "data": json.dumps({"session_id": "s1", "payload": "bad"}),
+                },
                 {
                     "type": "pmessage",
                     "data": json.dumps(
@@ -772,9 +885,11 @@ async def test_pubsub_loop_ignores_empty_bad_json_same_sender_and_no_data(monkey
         async def subscribe(self, *_args):
             return None
 
-        async def get_message(self, **_kwargs):
+        async def get_message(self, **kwargs):
             if self.messages:
                 return self.messages.pop(0)
+            if kwargs.get("timeout") == 0:
+                return None
             raise asyncio.CancelledError()
 
         async def aclose(self):
@@ -784,3 +899,68 @@ async def test_pubsub_loop_ignores_empty_bad_json_same_sender_and_no_data(monkey
     with pytest.raises(asyncio.CancelledError):
         await mgr._pubsub_loop()
     assert called["viewer"] == 0
+
+
+@pytest.mark.asyncio
+async def test_pubsub_loop_drains_batch_and_drops_superseded_partials(monkeypatch):
+    mgr, redis = build_manager(monkeypatch)
+    delivered = []
+
+    async def send_local(session_id, payload):
+        delivered.append((session_id, payload["message_id"], payload["type"]))
+
+    monkeypatch.setattr(mgr, "_send_to_local_viewers", send_local)
+
+    def event(message_id, msg_type, session_id="s1"):
+        return {
+            "type": "pmessage",
+            "data": json.dumps(
+                {
+                    "sender_instance": "other",
+                    "session_id": session_id,
+                    "payload": {"message_id": message_id, "type": msg_type},
+                }
+            ),
+        }
+
+    class FakePubSub:
+        def __init__(self):
+            self.messages = [
+                event("1_en", "partial"),
+                event("1_en", "partial"),
+                event("1_en", "partial", session_id="s2"),
+                event("1_en", "final"),
+                event("2_en", "partial"),
+            ]
+            self.calls = []
+
+        async def psubscribe(self, *_args):
+            return None
+
+        async def subscribe(self, *_args):
+            return None
+
+        async def get_message(self, **kwargs):
+            self.calls.append(kwargs.get("timeout"))
+            if self.messages:
+                return self.messages.pop(0)
+            if kwargs.get("timeout") == 0:
+                return None
+            raise asyncio.CancelledError()
+
+        async def aclose(self):
+            return None
+
+    pubsub = FakePubSub()
+    redis.pubsub = lambda: pubsub
+
+    with pytest.raises(asyncio.CancelledError):
+        await mgr._pubsub_loop()
+
+    assert delivered == [
+        ("s2", "1_en", "partial"),
+        ("s1", "1_en", "final"),
+        ("s1", "2_en", "partial"),
+    ]
+    assert pubsub.calls[0] == 1.0
+    assert pubsub.calls[1:6] == [0, 0, 0, 0, 0]
@@ -243,3 +243,10 @@ async def test_send_session_transcripts_skips_when_no_transcript(monkeypatch, sv
     await svc.send_session_transcripts("s1", "zoom", attendees)
 
     assert sent == []
+
+
+def test_get_email_service_is_shared(monkeypatch):
+    monkeypatch.setattr(email.msal, "ConfidentialClientApplication", lambda *a, **k: FakeMsalApp())
+    monkeypatch.setattr(email, "_shared_email_service", None)
+    first = email.get_email_service()
+    assert email.get_email_service() is first
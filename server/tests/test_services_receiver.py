@@ -140,17 +140,32 @@ class FakeSocket:
         self.disconnect = disconnect
         self.closed = []
 
-    async def receive_text(self):
+    async def receive(self):
         if not self.messages:
             if self.disconnect:
-                raise WebSocketDisconnect()
+                return {"type": "websocket.disconnect", "code": 1006}
             raise RuntimeError("no more messages")
-        return self.messages.pop(0)
+        message = self.messages.pop(0)
+        if isinstance(message, bytes):
+            return {"type": "websocket.receive", "bytes": message}
+        return {"type": "websocket.receive", "text": message}
 
     async def close(self, code, reason):
         self.closed.append((code, reason))
 
 
+@pytest.fixture
+def partial_clock(monkeypatch):
+    """
+    Freezes the partial throttle's clock and stretches its interval so only
+    explicit clock moves (never CI slowness) decide what is coalesced.
+    """
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(receiver, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    monkeypatch.setattr(receiver, "PARTIAL_BROADCAST_INTERVAL_SECONDS", 60)
+    return clock
+
+
 @pytest.fixture(autouse=True)
 def clear_active_sessions():
     receiver.ACTIVE_SESSIONS.clear()
@@ -251,6 +266,7 @@ async def test_stream_handler_message_pipeline(monkeypatch):
             end_ms=100,
         )
     )
+    await asyncio.sleep(0)
     await h._on_transcription_message(
         SonioxResult(
             transcription="hello",
@@ -269,6 +285,163 @@ async def test_stream_handler_message_pipeline(monkeypatch):
     assert vm.broadcasts[1][1]["type"] == "final"
 
 
+@pytest.mark.asyncio
+async def test_stream_handler_coalesces_rapid_partials(partial_clock):
+    vm = FakeViewerManager()
+    h = receiver.StreamHandler(
+        language_code="en",
+        session_id="s1",
+        viewer_manager=vm,
+        loop=asyncio.get_running_loop(),
+        session_start_time=receiver.datetime.now(),
+    )
+    h.stream_ready.set()
+
+    def partial(text):
+        return SonioxResult(transcription=text, translation="", is_final=False)
+
+    for text in ("hel", "hell", "hello", "hello " + "x" * 40, "hello x.", "hello x. t"):
+        await h._on_transcription_message(partial(text))
+        await asyncio.sleep(0)
+    await h._on_transcription_message(
+        SonioxResult(transcription="hello there", translation="", is_final=True)
+    )
+    await h._on_transcription_message(partial("next"))
+    await asyncio.sleep(0)
+
+    sent = [(p["type"], p["transcription"]) for _, p in vm.broadcasts]
+    assert sent == [
+        ("partial", "hel"),
+        ("partial", "hello " + "x" * 40),
+        ("partial", "hello x."),
+        ("final", "hello there"),
+        ("partial", "next"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_handler_skips_unchanged_partials(monkeypatch):
+    vm = FakeViewerManager()
+    monkeypatch.setattr(receiver, "PARTIAL_BROADCAST_MIN_CHARS", 0)
+    h = receiver.StreamHandler(
+        language_code="en",
+        session_id="s1",
+        viewer_manager=vm,
+        loop=asyncio.get_running_loop(),
+        session_start_time=receiver.datetime.now(),
+    )
+    h.stream_ready.set()
+
+    def partial(text):
+        return SonioxResult(transcription=text, translation="", is_final=False)
+
+    for text in ("hi", "hi", "hi there"):
+        await h._on_transcription_message(partial(text))
+        await asyncio.sleep(0)
+    await h._on_transcription_message(
+        SonioxResult(transcription="hi there", translation="", is_final=True)
+    )
+    await h._on_transcription_message(partial("hi"))
+    await asyncio.sleep(0)
+
+    sent = [(p["type"], p["transcription"]) for _, p in vm.broadcasts]
+    assert sent == [
+        ("partial", "hi"),
+        ("partial", "hi there"),
+        ("final", "hi there"),
+        ("partial", "hi"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_handler_flushes_held_partial_after_interval(partial_clock):
+    vm = FakeViewerManager()
+    h = receiver.StreamHandler(
+        language_code="en",
+        session_id="s1",
+        viewer_manager=vm,
+        loop=asyncio.get_running_loop(),
+        session_start_time=receiver.datetime.now(),
+    )
+    h.stream_ready.set()
+
+    def partial(text):
+        return SonioxResult(transcription=text, translation="", is_final=False)
+
+    await h._on_transcription_message(partial("hel"))
+    await asyncio.sleep(0)
+    partial_clock.now += 1
+    await h._on_transcription_message(partial("hell"))
+    await h._on_transcription_message(partial("hello"))
+
+    timer = h._held_partial_timer
+    assert timer is not None
+    assert timer.when() - asyncio.get_running_loop().time() == pytest.approx(59, abs=1)
+    timer.cancel()
+    h._release_held_partial()
+    await asyncio.sleep(0)
+
+    sent = [(p["type"], p["transcription"]) for _, p in vm.broadcasts]
+    assert sent == [("partial", "hel"), ("partial", "hello")]
+
+    await h._on_transcription_message(partial("hello w"))
+    await h._on_transcription_message(
+        SonioxResult(transcription="hello world", translation="", is_final=True)
+    )
+    await h._on_transcription_message(partial("next"))
+    await asyncio.sleep(0)
+    await h._on_transcription_message(partial("next o"))
+    await h._on_transcription_message(partial("next " + "o" * 40))
+    await h.close()
+    await asyncio.sleep(0)
+
+    sent = [(p["type"], p["transcription"]) for _, p in vm.broadcasts]
+    assert sent[2:] == [("final", "hello world"), ("partial", "next")]
+    assert h._held_partial is None and h._held_partial_timer is None
+
+
+@pytest.mark.asyncio
+async def test_stream_handler_sends_only_latest_partial_while_busy(monkeypatch):
+    vm = FakeViewerManager()
+    release = asyncio.Event()
+    sent = []
+
+    async def slow_broadcast(session_id, payload):
+        sent.append((payload["type"], payload["transcription"]))
+        if len(sent) == 1:
+            await release.wait()
+        if payload["transcription"] == "boom":
+            raise RuntimeError("send failed")
+
+    vm.broadcast_to_session = slow_broadcast
+    monkeypatch.setattr(receiver, "PARTIAL_BROADCAST_MIN_CHARS", 0)
+    h = receiver.StreamHandler(
+        language_code="en",
+        session_id="s1",
+        viewer_manager=vm,
+        loop=asyncio.get_running_loop(),
+        session_start_time=receiver.datetime.now(),
+    )
+    h.stream_ready.set()
+
+    def partial(text):
+        return SonioxResult(transcription=text, translation="", is_final=False)
+
+    await h._on_transcription_message(partial("a"))
+    await asyncio.sleep(0)
+    await h._on_transcription_message(partial("ab"))
+    await h._on_transcription_message(partial("abc"))
+    release.set()
+    await h._on_transcription_message(
+        SonioxResult(transcription="abc.", translation="", is_final=True)
+    )
+    assert sent == [("partial", "a"), ("final", "abc.")]
+
+    await h._on_transcription_message(partial("boom"))
+    await h._partial_broadcast_task
+    assert sent[-1] == ("partial", "boom")
+
+
 @pytest.mark.asyncio
 async def test_stream_handler_connect_send_keepalive_close(monkeypatch):
     vm = FakeViewerManager()
@@ -539,6 +712,49 @@ async def test_meeting_session_add_remove_dispatch_and_update(monkeypatch):
     assert ("s1", "fr") in vm.cleared
 
 
+@pytest.mark.asyncio
+async def test_meeting_session_dispatch_audio_sends_to_streams_concurrently():
+    ms = receiver.MeetingSession(
+        session_id="s1",
+        integration="zoom",
+        viewer_manager=FakeViewerManager(),
+        loop=asyncio.get_running_loop(),
+        lease=SimpleNamespace(),
+        backfill_service=SimpleNamespace(),
+        summary_service=SimpleNamespace(),
+    )
+    gate = asyncio.Event()
+    events = []
+
+    class SlowHandler:
+        def __init__(self, name):
+            self.name = name
+
+        def update_speaker(self, speaker):
+            events.append(("speaker", self.name, speaker))
+
+        async def send_audio(self, chunk):
+            events.append(("start", self.name))
+            await gate.wait()
+            events.append(("sent", self.name, chunk))
+
+    ms.active_handlers = {"en": SlowHandler("en")}
+    gate.set()
+    await ms.dispatch_audio("Ann", b"a")
+    assert events[-1] == ("sent", "en", b"a")
+
+    events.clear()
+    gate.clear()
+    ms.active_handlers = {"en": SlowHandler("en"), "fr": SlowHandler("fr")}
+    dispatch = asyncio.create_task(ms.dispatch_audio("Bo", b"b"))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert ("start", "en") in events and ("start", "fr") in events
+    gate.set()
+    await dispatch
+    assert ("sent", "fr", b"b") in events
+
+
 @pytest.mark.asyncio
 async def test_meeting_session_add_language_stream_skips_and_errors(monkeypatch):
     vm = FakeViewerManager()
@@ -606,7 +822,7 @@ async def test_meeting_session_email_attendees_and_close_session(monkeypatch):
         [FakeDbResult(), FakeDbResult(scalar=meeting), FakeDbResult(mappings_rows=attendee_rows)]
     )
     monkeypatch.setattr(receiver, "AsyncSessionLocal", db_factory)
-    monkeypatch.setattr(receiver, "EmailService", lambda: FakeEmail())
+    monkeypatch.setattr(receiver, "get_email_service", lambda: FakeEmail())
     removed = []
     monkeypatch.setattr(receiver, "remove_session_log_handler", lambda h: removed.append(h))
 
@@ -878,6 +1094,63 @@ async def test_handle_receiver_session_happy_path_and_graceful_end(monkeypatch):
     assert "s3" not in receiver.ACTIVE_SESSIONS
 
 
+@pytest.mark.asyncio
+async def test_handle_receiver_session_binary_audio_uses_announced_speaker(monkeypatch):
+    vm = FakeViewerManager()
+    ws = FakeSocket(
+        messages=[
+            json.dumps({"type": "session_start"}),
+            b"pcm-unknown",
+            json.dumps({"userName": "Bo"}),
+            b"",
+            b"pcm-bo",
+            json.dumps({"type": "session_end"}),
+        ]
+    )
+
+    class FakeLease:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        async def acquire(self, wait_timeout_seconds):
+            return True
+
+    created = {}
+
+    class FakeMeetingSession:
+        def __init__(self, session_id, integration, viewer_manager, loop, lease, backfill_service, summary_service):
+            self.db_start_written = False
+            self.dispatched = []
+            created["obj"] = self
+
+        async def initialize(self):
+            return None
+
+        def update_start_time(self, ts):
+            return None
+
+        async def dispatch_audio(self, speaker, chunk):
+            self.dispatched.append((speaker, chunk))
+
+        async def close_session(self):
+            return None
+
+    monkeypatch.setattr(receiver, "AsyncSessionLocal", fake_session_factory([FakeDbResult()]))
+    monkeypatch.setattr(receiver, "ReceiverLease", FakeLease)
+    monkeypatch.setattr(receiver, "MeetingSession", FakeMeetingSession)
+
+    await receiver.handle_receiver_session(
+        websocket=ws,
+        integration="zoom",
+        session_id="s3b",
+        viewer_manager=vm,
+        backfill_service=SimpleNamespace(),
+        summary_service=SimpleNamespace(),
+    )
+
+    assert created["obj"].dispatched == [("Unknown", b"pcm-unknown"), ("Bo", b"pcm-bo")]
+
+
 @pytest.mark.asyncio
 async def test_handle_receiver_session_fallback_start_and_disconnect_cleanup(monkeypatch):
     vm = FakeViewerManager()
@@ -74,6 +74,12 @@ def test_get_config_one_way_and_two_way(callbacks):
     assert cfg2["translation"]["type"] == "two_way"
 
 
+def test_combine_text_joins_final_and_non_final():
+    assert soniox._combine_text("Hello ", "") == "Hello"
+    assert soniox._combine_text("", " wor") == "wor"
+    assert soniox._combine_text("Hello", "world ") == "Hello world"
+
+
 @pytest.mark.asyncio
 async def test_receive_loop_partial_and_end_final(callbacks):
     calls, _, _, _ = callbacks
@@ -179,12 +185,13 @@ async def test_receive_loop_connection_closed_paths(callbacks):
         Close(1000, "done"), Close(1000, "done"), rcvd_then_sent=True
     )
     svc_ok = make_service(callbacks)
-    svc_ok.final_transcription_tokens = ["bye"]
+    svc_ok.final_transcription_text = "bye"
     svc_ok.ws = FakeWS(raise_exc=ok_exc)
     svc_ok._is_connected = True
     await svc_ok._receive_loop()
     assert calls["closes"][-1][0] == 1000
     assert calls["messages"][-1].is_final is True
+    assert calls["messages"][-1].transcription == "bye"
 
     err_exc = ConnectionClosedError(
         Close(1011, "err"), Close(1011, "err"), rcvd_then_sent=True
@@ -246,7 +253,8 @@ async def test_connect_send_chunk_send_json_finalize(monkeypatch, callbacks):
     await svc.finalize_stream()
 
     assert b"abc" in fake_ws.sent
-    assert json.dumps({"type": "keepalive"}) in fake_ws.sent
+    text_frames = [m for m in fake_ws.sent if isinstance(m, str) and m]
+    assert {"type": "keepalive"} in [json.loads(m) for m in text_frames]
     assert "" in fake_ws.sent
     assert svc._is_connected is False
 
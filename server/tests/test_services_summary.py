@@ -44,6 +44,7 @@ def test_summary_service_init_with_api_key(monkeypatch):
     svc = summary.SummaryService()
     assert "headers" in captured
     assert "Authorization" in captured["headers"]
+    assert captured["limits"].max_connections == summary.SUMMARY_CONCURRENCY
     assert svc.model == "model-x"
 
 
@@ -76,22 +77,6 @@ def test_clean_vtt_content_handles_bad_timestamp(summary_service):
     assert "**Alice:** Hi" in out
 
 
-def test_clean_vtt_content_timestamp_parse_exception_branch(summary_service):
-    class BadStr(str):
-        def split(self, *args, **kwargs):
-            raise ValueError("bad split")
-
-        def strip(self):
-            return self
-
-    class WeirdContent:
-        def splitlines(self):
-            return [BadStr("00:00:01.000 --> 00:00:02.000"), "Alice: Hi"]
-
-    out = summary_service._clean_vtt_content(WeirdContent())
-    assert "**Alice:** Hi" in out
-
-
 @pytest.mark.asyncio
 async def test_generate_single_summary_success(monkeypatch, summary_service, tmp_path):
     writes = {}
@@ -108,6 +93,34 @@ async def test_generate_single_summary_success(monkeypatch, summary_service, tmp
     assert any("summary_en.txt" in k for k in writes)
 
 
+@pytest.mark.asyncio
+async def test_generate_single_summary_keeps_language_out_of_prompt_prefix(
+    monkeypatch, summary_service, tmp_path
+):
+    prompts = []
+
+    async def capture_chat(model, messages):
+        prompts.append(messages)
+        return {"message": {"content": "ok"}}
+
+    async def fake_write(path, content):
+        return None
+
+    summary_service.client.chat = capture_chat
+    summary_service._write_text_file = fake_write
+    monkeypatch.setattr(summary, "AsyncSessionLocal", fake_session_local(FakeResult(), FakeResult()))
+
+    await summary_service._generate_single_summary("text", "en", str(tmp_path), "s1")
+    await summary_service._generate_single_summary("text", "fr", str(tmp_path), "s1")
+
+    en_prompt, fr_prompt = prompts
+    assert en_prompt[0] == fr_prompt[0]
+    assert en_prompt[1]["content"].startswith("TRANSCRIPT:\ntext")
+    assert fr_prompt[1]["content"].startswith("TRANSCRIPT:\ntext")
+    assert en_prompt[1]["content"].endswith("'en'.")
+    assert fr_prompt[1]["content"].endswith("'fr'.")
+
+
 @pytest.mark.asyncio
 async def test_generate_single_summary_failure(monkeypatch, summary_service):
     async def bad_chat(model, messages):
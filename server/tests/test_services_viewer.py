@@ -1,22 +1,24 @@
 from types import SimpleNamespace
 
 import pytest
-from fastapi import WebSocketDisconnect
 
 from services import viewer
 from tests.helpers import FakeResult, fake_session_local
 
 
 class FakeWebSocket:
-    def __init__(self):
+    def __init__(self, incoming=None):
         self.sent = []
         self.closed = None
+        self.incoming = list(incoming or [])
 
     async def send_json(self, payload):
         self.sent.append(payload)
 
-    async def receive_text(self):
-        raise WebSocketDisconnect()
+    async def receive(self):
+        if self.incoming:
+            return self.incoming.pop(0)
+        return {"type": "websocket.disconnect", "code": 1001}
 
     async def close(self, code, reason=None):
         self.closed = (code, reason)
@@ -54,6 +56,17 @@ async def test_handle_viewer_session_active_flow_disconnects():
     assert mgr.disconnected == ["s1"]
 
 
+@pytest.mark.asyncio
+async def test_handle_viewer_session_ignores_client_frames_until_disconnect():
+    ws = FakeWebSocket(incoming=[{"type": "websocket.receive", "text": "ping"}])
+    mgr = FakeViewerManager(active_map={"s1": True})
+
+    await viewer.handle_viewer_session(ws, "s1", mgr, "en", "u1")
+
+    assert ws.incoming == []
+    assert mgr.disconnected == ["s1"]
+
+
 @pytest.mark.asyncio
 async def test_handle_viewer_session_waiting_two_way_from_db(monkeypatch):
     row = SimpleNamespace(platform="standalone", translation_type="two_way", readable_id=None)
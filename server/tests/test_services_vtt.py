@@ -16,6 +16,8 @@ def test_timestamp_service_marks_and_completes_with_offsets():
     ts = vtt.TimestampService(start_time=datetime(2026, 1, 1, 0, 0, 0))
     ts.mark_utterance_start("1_a", start_ms=1500)
     stamp = ts.complete_utterance("1_a", end_ms=2200)
+    assert ts._utterance_start_times == {}
+    assert ts._utterance_start_offsets_ms == {}
     assert stamp == "00:00:01.500 --> 00:00:02.200"
 
 